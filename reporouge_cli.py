@@ -7,12 +7,24 @@ Run directly without installation: python reporouge_cli.py
 
 import sys
 import subprocess
-import importlib.util
+import importlib
+import hashlib
+from pathlib import Path
+
+# Configuration
+CLI_VERSION = "1.0.0"
+CONFIG_DIR = Path.home() / ".reporouge"
+CONFIG_FILE = CONFIG_DIR / "config.json"
+CACHE_DIR = CONFIG_DIR / "cache"
+# One marker per interpreter, so a new venv or Python still gets its dependencies installed
+_INTERPRETER_ID = hashlib.sha256(f"{sys.prefix}|{sys.executable}".encode('utf-8')).hexdigest()[:16]
+DEPS_SENTINEL = CONFIG_DIR / f".deps_ok_{_INTERPRETER_ID}"
 
 # Auto-install required packages
 REQUIRED_PACKAGES = {
     'click': 'click>=8.0.0',
-    'requests': 'requests>=2.25.0'
+    'requests': 'requests>=2.25.0',
+    'pathspec': 'pathspec>=0.10.0'
 }
 
 def install_package(package_name, package_spec):
@@ -25,12 +37,16 @@ def install_package(package_name, package_spec):
     except subprocess.CalledProcessError:
         return False
 
-def check_and_install_dependencies():
-    """Check and auto-install required dependencies"""
-    missing_packages = []
+def check_and_install_dependencies(force: bool = False):
+    """Check and auto-install required dependencies (once per interpreter unless forced)"""
+    if not force and DEPS_SENTINEL.exists():
+        return
     
+    missing_packages = []
     for package_name, package_spec in REQUIRED_PACKAGES.items():
-        if importlib.util.find_spec(package_name) is None:
+        try:
+            importlib.import_module(package_name)
+        except ImportError:
             missing_packages.append((package_name, package_spec))
     
     if missing_packages:
@@ -43,34 +59,75 @@ def check_and_install_dependencies():
                 print(f"   ❌ Failed to install {package_name}")
                 print(f"   Please run: pip install {package_spec}")
                 sys.exit(1)
+        importlib.invalidate_caches()
         print("🎉 All dependencies installed!")
+    
+    try:
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        DEPS_SENTINEL.touch()
+    except OSError:
+        # Not fatal - we'll simply check again on the next run
+        pass
 
-# Install dependencies before importing them
-check_and_install_dependencies()
-
-import click
-import requests
+try:
+    import click
+except ImportError:
+    # Importing as a library never installs anything; only a direct run does
+    if __name__ != '__main__':
+        raise
+    # Something is missing despite the marker (e.g. uninstalled since), so probe again
+    check_and_install_dependencies(force=True)
+    import click
 import json
 import os
-import zipfile
-import tempfile
-import shutil
-from pathlib import Path
 from typing import Optional, Dict, Any
-import difflib
-from datetime import datetime
 
-# Configuration
-CLI_VERSION = "1.0.0"
-CONFIG_DIR = Path.home() / ".reporouge"
-CONFIG_FILE = CONFIG_DIR / "config.json"
-CACHE_DIR = CONFIG_DIR / "cache"
+# Use orjson for JSON encoding/decoding when it's available (optional speedup)
+try:
+    import orjson
+    
+    def _dumps(obj: Any, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any, indent: bool = False) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+    
+    _loads = json.loads
+
+_requests = None
+
+def _import_dependency(module_name: str):
+    """Import a required package, installing it first if it's missing and we run as a script"""
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        if __name__ != '__main__':
+            raise
+        check_and_install_dependencies(force=True)
+        return importlib.import_module(module_name)
+
+def _get_requests():
+    """Import requests on first use so that --help and local-only commands stay fast"""
+    global _requests
+    if _requests is None:
+        _requests = _import_dependency('requests')
+    return _requests
+
+def _response_json(response) -> Any:
+    """Decode a JSON response body, reporting bad bodies as a requests error like response.json()"""
+    try:
+        return _loads(response.content)
+    except ValueError as e:
+        raise _get_requests().exceptions.RequestException(f"Invalid JSON in response: {e}", response=response)
 
 class RepoRougeConfig:
     def __init__(self):
         self.config_dir = CONFIG_DIR
         self.config_file = CONFIG_FILE
         self.cache_dir = CACHE_DIR
+        self._cached_config = None
         self.ensure_config_dir()
     
     def ensure_config_dir(self):
@@ -79,14 +136,17 @@ class RepoRougeConfig:
         self.cache_dir.mkdir(parents=True, exist_ok=True)
     
     def load_config(self) -> Dict[str, Any]:
-        """Load configuration from file"""
+        """Load configuration from file (cached after the first successful read)"""
+        if self._cached_config is not None:
+            return self._cached_config
+        
         if not self.config_file.exists():
             return {"server_url": "https://repo-rouge.onrender.com", "token": None, "username": None}
         
         try:
-            with open(str(self.config_file), 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+            self._cached_config = _loads(self.config_file.read_bytes())
+            return self._cached_config
+        except (ValueError, OSError) as e:
             # If config file is corrupted, return default config
             return {"server_url": "https://repo-rouge.onrender.com", "token": None, "username": None}
     
@@ -95,8 +155,8 @@ class RepoRougeConfig:
         try:
             # Ensure the parent directory exists
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(str(self.config_file), 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
+            self.config_file.write_bytes(_dumps(config, indent=True))
+            self._cached_config = config
         except IOError as e:
             raise click.ClickException(f"Failed to save configuration: {e}")
     
@@ -105,73 +165,325 @@ class RepoRougeConfig:
         repo_config_path = Path(".reporouge") / "config.json"
         if repo_config_path.exists():
             try:
-                with open(str(repo_config_path), 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
+                return _loads(repo_config_path.read_bytes())
+            except (ValueError, OSError):
                 return None
         return None
+    
+    def get_local_index(self) -> Dict[str, Any]:
+        """Get the {path: {sha256, size, mtime_ns}} index recorded at the last clone, pull or push"""
+        index_path = Path(".reporouge") / "index.json"
+        try:
+            return _loads(index_path.read_bytes())
+        except (ValueError, OSError):
+            return {}
+    
+    def save_local_index(self, index: Dict[str, Any], repo_dir: Path = Path(".")):
+        """Save the local content index"""
+        index_path = repo_dir / ".reporouge" / "index.json"
+        try:
+            index_path.write_bytes(_dumps(index))
+        except IOError:
+            # The index is only an optimisation - without it the next push sends everything
+            pass
 
 class RepoRougeAPI:
     def __init__(self, base_url: str, token: Optional[str] = None):
         self.base_url = base_url.rstrip('/')
+        self._api_prefix = f"{self.base_url}/api/repos"
         self.token = token
+        requests = _get_requests()
         self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({"Connection": "keep-alive"})
         if token:
             self.session.headers.update({"Authorization": f"Bearer {token}"})
     
     def login(self, email: str, password: str) -> Dict[str, Any]:
-        """Login to RepoRouge"""
+        """Login to RepoRouge (servers that support it also return the CLI token)"""
         response = self.session.post(f"{self.base_url}/auth/login", json={
             "email": email,
             "password": password
-        })
+        }, params={"issue_cli_token": 1})
         response.raise_for_status()
-        return response.json()
+        return _response_json(response)
     
     def get_cli_token(self) -> Dict[str, Any]:
         """Get CLI token for long-term usage"""
         response = self.session.post(f"{self.base_url}/auth/cli-token")
         response.raise_for_status()
-        return response.json()
+        return _response_json(response)
     
-    def clone_repo(self, owner: str, repo_name: str, branch: str = "main") -> bytes:
-        """Clone repository as ZIP"""
-        response = self.session.get(f"{self.base_url}/api/repos/{owner}/{repo_name}/clone?branch={branch}")
+    def clone_repo(self, owner: str, repo_name: str, branch: str = "main") -> Any:
+        """Clone repository as ZIP (returns the streaming response)"""
+        response = self.session.get(f"{self._api_prefix}/{owner}/{repo_name}/clone?branch={branch}", stream=True)
         response.raise_for_status()
-        return response.content
+        return response
+    
+    def _cached_get(self, url: str) -> Dict[str, Any]:
+        """GET a JSON resource, revalidating a copy cached under CACHE_DIR with its ETag"""
+        # The token is part of the key so different accounts never share entries
+        key = hashlib.sha256(f"{self.token}\n{url}".encode('utf-8')).hexdigest()
+        cache_path = CACHE_DIR / f"{key}.json"
+        try:
+            cached = _loads(cache_path.read_bytes())
+        except (ValueError, OSError):
+            cached = None
+        if not (isinstance(cached, dict) and "etag" in cached and "body" in cached):
+            # Missing or malformed entries are treated as a cache miss
+            cached = None
+        
+        headers = {"If-None-Match": cached["etag"]} if cached else {}
+        response = self.session.get(url, headers=headers)
+        if cached and response.status_code == 304:
+            return cached["body"]
+        response.raise_for_status()
+        body = _response_json(response)
+        
+        etag = response.headers.get("ETag")
+        if etag:
+            try:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                cache_path.write_bytes(_dumps({"etag": etag, "body": body}))
+            except IOError:
+                # Caching is only an optimisation - the next call simply fetches again
+                pass
+        return body
     
     def get_repo_info(self, owner: str, repo_name: str) -> Dict[str, Any]:
         """Get repository information"""
-        response = self.session.get(f"{self.base_url}/api/repos/{owner}/{repo_name}/info")
-        response.raise_for_status()
-        return response.json()
+        return self._cached_get(f"{self._api_prefix}/{owner}/{repo_name}/info")
     
     def get_branches(self, owner: str, repo_name: str) -> Dict[str, Any]:
         """Get repository branches"""
-        response = self.session.get(f"{self.base_url}/repos/{repo_name}/branches")
-        response.raise_for_status()
-        return response.json()
+        return self._cached_get(f"{self.base_url}/repos/{repo_name}/branches")
     
     def switch_branch(self, owner: str, repo_name: str, branch: str) -> Dict[str, Any]:
         """Switch to a branch"""
         response = self.session.post(f"{self.base_url}/repos/{repo_name}/branches/{branch}/switch")
         response.raise_for_status()
-        return response.json()
+        return _response_json(response)
     
     def push_files(self, owner: str, repo_name: str, files: list, branch: str = "main") -> Dict[str, Any]:
-        """Push files to repository"""
-        response = self.session.post(f"{self.base_url}/api/repos/{owner}/{repo_name}/push", json=files, params={"branch": branch})
+        """Push files to repository (gzip-compressed JSON body)"""
+        import gzip
+        body = gzip.compress(_dumps(files), compresslevel=3)
+        response = self.session.post(
+            f"{self._api_prefix}/{owner}/{repo_name}/push",
+            data=body,
+            headers={"Content-Encoding": "gzip", "Content-Type": "application/json"},
+            params={"branch": branch}
+        )
         response.raise_for_status()
-        return response.json()
+        return _response_json(response)
     
     def get_file_diff(self, owner: str, repo_name: str, file_path: str, branch: str = "main") -> Dict[str, Any]:
         """Get file for diff comparison"""
-        response = self.session.get(f"{self.base_url}/api/repos/{owner}/{repo_name}/diff", params={
+        response = self.session.get(f"{self._api_prefix}/{owner}/{repo_name}/diff", params={
             "file_path": file_path,
             "branch": branch
         })
         response.raise_for_status()
-        return response.json()
+        return _response_json(response)
+
+_API_CACHE: Dict[tuple, RepoRougeAPI] = {}
+
+def get_api(base_url: str, token: Optional[str] = None) -> RepoRougeAPI:
+    """Get a shared API client so requests to the same server reuse one connection pool"""
+    key = (base_url.rstrip('/'), token)
+    api = _API_CACHE.get(key)
+    if api is None:
+        api = _API_CACHE[key] = RepoRougeAPI(base_url, token)
+    return api
+
+# ZIP downloads up to this size stay in memory; larger ones spill to a temp file
+ZIP_SPOOL_MAX_SIZE = 16 * 1024 * 1024
+
+def read_zip_response(response) -> Any:
+    """Stream a ZIP response body into memory, moving it to a temp file past ZIP_SPOOL_MAX_SIZE
+    
+    Spooled by hand because SpooledTemporaryFile has no seekable() before Python 3.11,
+    which ZipFile needs to read members.
+    """
+    import io
+    import tempfile
+    spool = io.BytesIO()
+    try:
+        with response:
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                spool.write(chunk)
+                if isinstance(spool, io.BytesIO) and spool.tell() > ZIP_SPOOL_MAX_SIZE:
+                    disk = tempfile.TemporaryFile()
+                    disk.write(spool.getvalue())
+                    spool = disk
+    except BaseException:
+        spool.close()
+        raise
+    spool.seek(0)
+    return spool
+
+def _verify_zip(zip_ref):
+    """CRC-check every member so a bad archive fails before anything local is deleted"""
+    import zipfile
+    bad_member = zip_ref.testzip()
+    if bad_member is not None:
+        raise zipfile.BadZipFile(f"Corrupt file in downloaded archive: {bad_member}")
+
+# Directories never scanned for working-tree files
+_SKIP_DIRS = frozenset({'.reporouge', '.git', 'node_modules', '__pycache__', '.venv'})
+IGNORE_FILE = ".reporougeignore"
+MAX_FILE_SIZE = 50 * 1024 * 1024
+
+def _load_ignore_spec(root: str = '.'):
+    """Compile .reporougeignore into a matcher, or return None if there is no ignore file"""
+    try:
+        lines = (Path(root) / IGNORE_FILE).read_text(encoding='utf-8').splitlines()
+    except OSError:
+        return None
+    # Only imported when there is an ignore file to compile
+    pathspec = _import_dependency('pathspec')
+    return pathspec.GitIgnoreSpec.from_lines(lines).match_file
+
+def _iter_files(root: str = '.', ignore=None, prefix: str = ''):
+    """Yield (relative_path, os.DirEntry) for working-tree files
+    
+    Directories in _SKIP_DIRS or matched by ``ignore`` are pruned without descending.
+    Relative paths always use '/' separators.
+    """
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        # Unreadable directory - skip it like os.walk would
+        return
+    for entry in entries:
+        relative_path = prefix + entry.name
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name in _SKIP_DIRS or (ignore and ignore(relative_path + '/')):
+                continue
+            yield from _iter_files(entry.path, ignore, relative_path + '/')
+        elif entry.is_file() and not (ignore and ignore(relative_path)):
+            yield relative_path, entry
+
+# Worker count for I/O-bound file reads and hashing (blocking I/O releases the GIL)
+_IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+def _hash_file(path: str) -> str:
+    """SHA-256 of a file, read in 64KB chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _index_record(st: os.stat_result, digest: str) -> Dict[str, Any]:
+    """Index entry for a file: its content hash plus the stat fields used as a fast check"""
+    return {"sha256": digest, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+def _stat_matches(st: os.stat_result, record: Optional[Dict[str, Any]]) -> bool:
+    """True if size and mtime are unchanged since the entry was recorded"""
+    return (record is not None
+            and record.get("size") == st.st_size
+            and record.get("mtime_ns") == st.st_mtime_ns)
+
+def _matches_index(path: str, st: os.stat_result, record: Optional[Dict[str, Any]]) -> bool:
+    """Check a file against its index entry, hashing only when size/mtime don't settle it"""
+    if record is None or record.get("size") != st.st_size:
+        return False
+    if record.get("mtime_ns") == st.st_mtime_ns:
+        return True
+    try:
+        return _hash_file(path) == record.get("sha256")
+    except OSError:
+        return False
+
+def _build_index(root: str = '.') -> Dict[str, Any]:
+    """Hash every pushable file under root into a {path: index entry} index"""
+    from concurrent.futures import ThreadPoolExecutor
+    candidates = []
+    for relative_path, entry in _iter_files(root, _load_ignore_spec(root)):
+        st = entry.stat()
+        if st.st_size <= MAX_FILE_SIZE:
+            candidates.append((relative_path, entry.path, st))
+    
+    def hash_one(candidate):
+        relative_path, file_path, st = candidate
+        try:
+            return relative_path, _index_record(st, _hash_file(file_path))
+        except OSError:
+            return relative_path, None
+    
+    with ThreadPoolExecutor(max_workers=_IO_WORKERS) as executor:
+        return {path: record for path, record in executor.map(hash_one, candidates) if record}
+
+def _extract_members(zip_ref, members, target):
+    """Extract archive members across threads (zlib releases the GIL while inflating)
+    
+    A ZipFile opened for reading serialises access to the underlying file itself, so
+    workers can share it. Only the directory creation inside extract() can race.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    def extract_one(member):
+        try:
+            zip_ref.extract(member, target)
+        except FileExistsError:
+            # Another worker created the same directory first - it exists now, so retry
+            zip_ref.extract(member, target)
+    
+    with ThreadPoolExecutor(max_workers=_IO_WORKERS) as executor:
+        # list() so that any extraction error is raised here
+        list(executor.map(extract_one, members))
+
+def _clear_member_path(member: str, checked: set):
+    """Unlink anything on a member's path that extraction must not write through or into
+    
+    Symlinks are removed wherever they appear, so extraction never follows one out of the
+    tree, and regular files are removed where the member needs a directory.
+    """
+    # Same sanitising ZipFile.extract applies to member names
+    parts = [part for part in member.split('/') if part not in ('', '.', '..')]
+    for depth in range(1, len(parts) + 1):
+        path = os.path.join(*parts[:depth])
+        if path in checked:
+            continue
+        checked.add(path)
+        is_parent = depth < len(parts) or member.endswith('/')
+        if os.path.islink(path) or (is_parent and os.path.lexists(path) and not os.path.isdir(path)):
+            os.unlink(path)
+
+def _extract_over_worktree(zip_buffer):
+    """Extract a branch ZIP over the current directory in place
+    
+    Files that are no longer in the archive are removed first, then the rest are
+    overwritten rather than deleted. .reporouge, _SKIP_DIRS and ignored files are kept.
+    """
+    import zipfile
+    existing = {relative_path for relative_path, _ in _iter_files('.', _load_ignore_spec())}
+    
+    with zipfile.ZipFile(zip_buffer, 'r') as zip_ref:
+        members = [m for m in zip_ref.namelist() if not m.startswith('.reporouge/')]
+        _verify_zip(zip_ref)
+        
+        # Remove stale files before extracting so a file can become a directory of the same name
+        for relative_path in existing.difference(members):
+            try:
+                os.unlink(relative_path)
+            except OSError:
+                continue
+            # Drop directories left empty by the removal (stops at the first non-empty one)
+            parent = os.path.dirname(relative_path)
+            if parent:
+                try:
+                    os.removedirs(parent)
+                except OSError:
+                    pass
+        
+        checked = set()
+        for member in members:
+            _clear_member_path(member, checked)
+        _extract_members(zip_ref, members, '.')
 
 # CLI Context
 @click.group()
@@ -188,7 +500,7 @@ def cli(ctx):
         if not config_manager.config_file.exists():
             click.echo("🚀 Welcome to RepoRouge CLI!")
             click.echo("This appears to be your first time running the CLI.")
-            click.echo(f"Configuration directory created at: {str(config_manager.config_dir)}")
+            click.echo(f"Configuration directory created at: {config_manager.config_dir}")
             click.echo("💡 To get started:")
             click.echo("1. Run 'python reporouge_cli.py login' to authenticate")
             click.echo("2. Run 'python reporouge_cli.py clone owner/repo-name' to clone a repository")
@@ -214,22 +526,27 @@ def cli(ctx):
 @click.pass_context
 def login(ctx, email: str, password: str, server: str):
     """Login to RepoRouge"""
+    requests = _get_requests()
     config_manager = ctx.obj['config']
-    api = RepoRougeAPI(server)
+    api = get_api(server)
     
     try:
         # Login and get token
         login_response = api.login(email, password)
         api.token = login_response['access_token']
         api.session.headers.update({"Authorization": f"Bearer {api.token}"})
+        # The client is now authenticated, so it no longer belongs under the anonymous key
+        _API_CACHE.pop((api.base_url, None), None)
         
-        # Get CLI token for long-term usage
-        cli_token_response = api.get_cli_token()
+        # Get CLI token for long-term usage, unless the login response already carried one
+        cli_token = login_response.get('cli_token')
+        if not cli_token:
+            cli_token = api.get_cli_token()['cli_token']
         
         # Save configuration
         config = {
             "server_url": server,
-            "token": cli_token_response['cli_token'],
+            "token": cli_token,
             "username": login_response['user']['username'],
             "email": login_response['user']['email']
         }
@@ -247,6 +564,10 @@ def login(ctx, email: str, password: str, server: str):
 @click.pass_context
 def clone(ctx, repo_url: str, branch: str, directory: Optional[str]):
     """Clone a repository"""
+    import shutil
+    import zipfile
+    from datetime import datetime
+    requests = _get_requests()
     config_manager = ctx.obj['config']
     config = config_manager.load_config()
     
@@ -260,32 +581,27 @@ def clone(ctx, repo_url: str, branch: str, directory: Optional[str]):
         click.echo("❌ Invalid repository URL. Use format: owner/repo-name", err=True)
         return
     
-    api = RepoRougeAPI(config['server_url'], config['token'])
+    api = get_api(config['server_url'], config['token'])
     
     try:
         # Get repository info first
         repo_info = api.get_repo_info(owner, repo_name)
         
-        # Clone repository
-        zip_data = api.clone_repo(owner, repo_name, branch)
-        
-        # Determine target directory
+        # Determine target directory, asking about overwriting before the download starts
         target_dir = Path(directory) if directory else Path(repo_name)
+        overwrite = target_dir.exists()
+        if overwrite and not click.confirm(f"Directory '{target_dir}' already exists. Overwrite?"):
+            return
         
-        if target_dir.exists():
-            if not click.confirm(f"Directory '{target_dir}' already exists. Overwrite?"):
-                return
-            shutil.rmtree(str(target_dir))
-        
-        # Extract ZIP
-        with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-            tmp_file.write(zip_data)
-            tmp_file.flush()
-            
-            with zipfile.ZipFile(tmp_file.name, 'r') as zip_ref:
-                zip_ref.extractall(str(target_dir))
+        # Clone repository
+        zip_response = api.clone_repo(owner, repo_name, branch)
         
-        os.unlink(tmp_file.name)
+        # Extract ZIP (the old directory is only removed once the download is complete)
+        with read_zip_response(zip_response) as spool, zipfile.ZipFile(spool, 'r') as zip_ref:
+            _verify_zip(zip_ref)
+            if overwrite:
+                shutil.rmtree(target_dir)
+            _extract_members(zip_ref, zip_ref.namelist(), target_dir)
         
         # Create local repository configuration
         repo_config_dir = target_dir / ".reporouge"
@@ -298,15 +614,14 @@ def clone(ctx, repo_url: str, branch: str, directory: Optional[str]):
             "cloned_at": datetime.now().isoformat()
         }
         
-        config_file_path = repo_config_dir / "config.json"
-        with open(str(config_file_path), 'w', encoding='utf-8') as f:
-            json.dump(local_config, f, indent=2)
+        (repo_config_dir / "config.json").write_bytes(_dumps(local_config, indent=True))
+        config_manager.save_local_index(_build_index(str(target_dir)), target_dir)
         
         click.echo(f"✅ Successfully cloned {repo_url} to {target_dir}")
         click.echo(f"📁 Branch: {branch}")
         click.echo(f"📝 Description: {repo_info.get('description', 'No description')}")
         
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, zipfile.BadZipFile) as e:
         click.echo(f"❌ Clone failed: {e}", err=True)
 
 @cli.command()
@@ -317,36 +632,58 @@ def status(ctx):
     repo_config = config_manager.get_local_repo_config()
     
     if not repo_config:
-        click.echo("❌ Not in a RepoRouge repository", err=True)
+        # Keep redirected output plain ASCII (no emoji to encode on cp1252 consoles)
+        marker = "❌ " if sys.stderr.isatty() else ""
+        click.echo(f"{marker}Not in a RepoRouge repository", err=True)
         return
     
-    click.echo(f"Repository: {repo_config['owner']}/{repo_config['repo_name']}")
-    click.echo(f"Current branch: {repo_config['current_branch']}")
-    click.echo(f"Cloned at: {repo_config['cloned_at']}")
+    header = (f"Repository: {repo_config['owner']}/{repo_config['repo_name']}\n"
+              f"Current branch: {repo_config['current_branch']}\n"
+              f"Cloned at: {repo_config['cloned_at']}")
     
-    # Show modified files (basic implementation)
-    click.echo("Modified files:")
+    # Compare the working tree against the index from the last clone, pull or push
+    index = config_manager.get_local_index()
+    changes = []
+    skipped = []
     try:
-        for root, dirs, files in os.walk('.'):
-            # Skip .reporouge directory
-            if '.reporouge' in root:
+        seen = set()
+        for relative_path, entry in _iter_files('.', _load_ignore_spec()):
+            # Oversized files still count as present, they are just never pushed
+            seen.add(relative_path)
+            st = entry.stat()
+            if st.st_size > MAX_FILE_SIZE:
+                skipped.append(relative_path)
                 continue
-            for file in files:
-                file_path = Path(root) / file
-                try:
-                    relative_path = file_path.relative_to('.')
-                    click.echo(f"  M {relative_path}")
-                except ValueError:
-                    # Skip files that can't be made relative
-                    continue
+            record = index.get(relative_path)
+            if record is None:
+                changes.append((relative_path, "A"))
+            elif not _matches_index(entry.path, st, record):
+                changes.append((relative_path, "M"))
+        # Paths that are merely ignored now are still on disk, so they aren't deletions
+        changes.extend((relative_path, "D") for relative_path in index.keys() - seen
+                       if not os.path.lexists(relative_path))
     except Exception:
-        click.echo("  Unable to scan for modified files")
+        click.echo(f"{header}\nModified files:\n  Unable to scan for modified files")
+        return
+    
+    # One write for the whole report rather than one per line
+    if changes:
+        # Sorted by path so the listing doesn't depend on directory order
+        lines = [header, "Modified files:"]
+        lines.extend(f"  {code} {relative_path}" for relative_path, code in sorted(changes))
+    else:
+        lines = [header, "Nothing modified, working tree clean"]
+    if skipped:
+        lines.append(f"Skipped (larger than {MAX_FILE_SIZE // (1024 * 1024)}MB):")
+        lines.extend(f"  {relative_path}" for relative_path in sorted(skipped))
+    click.echo("\n".join(lines))
 
 @cli.command()
 @click.option('--all', '-a', is_flag=True, help='Show all branches')
 @click.pass_context
 def branch(ctx, all: bool):
     """List branches or show current branch"""
+    requests = _get_requests()
     config_manager = ctx.obj['config']
     repo_config = config_manager.get_local_repo_config()
     config = config_manager.load_config()
@@ -355,7 +692,7 @@ def branch(ctx, all: bool):
         click.echo("❌ Not in a RepoRouge repository or not logged in", err=True)
         return
     
-    api = RepoRougeAPI(config['server_url'], config['token'])
+    api = get_api(config['server_url'], config['token'])
     
     try:
         branches_info = api.get_branches(repo_config['owner'], repo_config['repo_name'])
@@ -377,6 +714,8 @@ def branch(ctx, all: bool):
 @click.pass_context
 def checkout(ctx, branch_name: str):
     """Switch to a different branch"""
+    import zipfile
+    requests = _get_requests()
     config_manager = ctx.obj['config']
     repo_config = config_manager.get_local_repo_config()
     config = config_manager.load_config()
@@ -385,7 +724,7 @@ def checkout(ctx, branch_name: str):
         click.echo("❌ Not in a RepoRouge repository or not logged in", err=True)
         return
     
-    api = RepoRougeAPI(config['server_url'], config['token'])
+    api = get_api(config['server_url'], config['token'])
     
     try:
         # Switch branch on server
@@ -393,36 +732,19 @@ def checkout(ctx, branch_name: str):
         
         # Update local config
         repo_config['current_branch'] = branch_name
-        config_path = Path('.reporouge') / 'config.json'
-        with open(str(config_path), 'w', encoding='utf-8') as f:
-            json.dump(repo_config, f, indent=2)
+        (Path('.reporouge') / 'config.json').write_bytes(_dumps(repo_config, indent=True))
         
         # Re-clone the branch content
-        zip_data = api.clone_repo(repo_config['owner'], repo_config['repo_name'], branch_name)
-        
-        # Clear current directory (except .reporouge)
-        for item in Path('.').iterdir():
-            if item.name != '.reporouge':
-                if item.is_dir():
-                    shutil.rmtree(str(item))
-                else:
-                    item.unlink()
-        
-        # Extract new branch content
-        with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-            tmp_file.write(zip_data)
-            tmp_file.flush()
-            
-            with zipfile.ZipFile(tmp_file.name, 'r') as zip_ref:
-                for member in zip_ref.namelist():
-                    if not member.startswith('.reporouge/'):
-                        zip_ref.extract(member, '.')
+        zip_response = api.clone_repo(repo_config['owner'], repo_config['repo_name'], branch_name)
         
-        os.unlink(tmp_file.name)
+        # Extract new branch content over the working tree
+        with read_zip_response(zip_response) as spool:
+            _extract_over_worktree(spool)
+        config_manager.save_local_index(_build_index('.'))
         
         click.echo(f"✅ Switched to branch '{branch_name}'")
         
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, OSError, zipfile.BadZipFile) as e:
         click.echo(f"❌ Checkout failed: {e}", err=True)
 
 @cli.command()
@@ -430,6 +752,9 @@ def checkout(ctx, branch_name: str):
 @click.pass_context
 def push(ctx, message: str):
     """Push changes to the repository"""
+    import base64
+    from concurrent.futures import ThreadPoolExecutor
+    requests = _get_requests()
     config_manager = ctx.obj['config']
     repo_config = config_manager.get_local_repo_config()
     config = config_manager.load_config()
@@ -438,38 +763,84 @@ def push(ctx, message: str):
         click.echo("❌ Not in a RepoRouge repository or not logged in", err=True)
         return
     
-    api = RepoRougeAPI(config['server_url'], config['token'])
+    api = get_api(config['server_url'], config['token'])
+    index = config_manager.get_local_index()
     
-    # Collect all files
+    def read_file(candidate):
+        relative_path, file_path, st = candidate
+        record = index.get(relative_path)
+        if _stat_matches(st, record):
+            # Untouched since the last clone, pull or push - no need to read it
+            return relative_path, record, None
+        
+        try:
+            data = Path(file_path).read_bytes()
+        except OSError:
+            # Skip files we can't read
+            return relative_path, None, None
+        
+        digest = hashlib.sha256(data).hexdigest()
+        new_record = _index_record(st, digest)
+        if record is not None and record.get("sha256") == digest:
+            # Touched but unchanged
+            return relative_path, new_record, None
+        
+        content = None
+        # A NUL byte in the first block is a cheap, reliable binary marker
+        if b'\x00' not in data[:8192]:
+            try:
+                content = data.decode('utf-8')
+            except UnicodeDecodeError:
+                pass
+        
+        file_entry = {"path": relative_path, "message": message}
+        if content is not None:
+            file_entry["content"] = content
+        else:
+            # Send binary (or non-UTF-8) files base64-encoded instead of dropping them
+            file_entry["content"] = base64.b64encode(data).decode('ascii')
+            file_entry["encoding"] = "base64"
+        return relative_path, new_record, file_entry
+    
+    # Collect changed files
     files_to_push = []
+    new_index = {}
     try:
-        for root, dirs, files in os.walk('.'):
-            # Skip .reporouge directory
-            if '.reporouge' in root:
+        candidates = []
+        scanned = set()
+        for relative_path, entry in _iter_files('.', _load_ignore_spec()):
+            scanned.add(relative_path)
+            # Check the size before reading so one huge file can't dominate the push
+            st = entry.stat()
+            if st.st_size > MAX_FILE_SIZE:
+                click.echo(f"⚠️  Skipping {relative_path} (larger than {MAX_FILE_SIZE // (1024 * 1024)}MB)")
                 continue
-            
-            for file in files:
-                file_path = Path(root) / file
-                try:
-                    relative_path = str(file_path.relative_to('.'))
-                    
-                    with open(str(file_path), 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    files_to_push.append({
-                        "path": relative_path,
-                        "content": content,
-                        "message": message
-                    })
-                except (UnicodeDecodeError, PermissionError, ValueError):
-                    # Skip binary files, files we can't read, or files with path issues
-                    continue
+            candidates.append((relative_path, entry.path, st))
+        
+        # Reads block on I/O (releasing the GIL), so fan them out across threads
+        with ThreadPoolExecutor(max_workers=_IO_WORKERS) as executor:
+            for relative_path, record, file_entry in executor.map(read_file, candidates):
+                if record is not None:
+                    new_index[relative_path] = record
+                if file_entry is not None:
+                    files_to_push.append(file_entry)
     except Exception as e:
         click.echo(f"❌ Error scanning files: {e}", err=True)
         return
     
+    # Entries for files that weren't pushed (skipped, unreadable or deleted) are kept as they
+    # were. Deletions can't be pushed, so deleted files stay listed as 'D' in status until a
+    # pull or checkout brings the tree back in line with the server.
+    for relative_path, record in index.items():
+        new_index.setdefault(relative_path, record)
+    deleted = sorted(path for path in index.keys() - scanned if not os.path.lexists(path))
+    if deleted:
+        click.echo(f"⚠️  Deleting files isn't supported by push; still on the server: {', '.join(deleted)}")
+    
     if not files_to_push:
-        click.echo("No files to push")
+        # Still save the refreshed stat fields so touched-but-unchanged files aren't rehashed
+        config_manager.save_local_index(new_index)
+        click.echo("No changes to push")
         return
     
     try:
@@ -479,6 +850,7 @@ def push(ctx, message: str):
             files_to_push, 
             repo_config['current_branch']
         )
+        config_manager.save_local_index(new_index)
         
         click.echo(f"✅ Successfully pushed {result['files']} files")
         
@@ -489,6 +861,8 @@ def push(ctx, message: str):
 @click.pass_context
 def pull(ctx):
     """Pull latest changes from the repository"""
+    import zipfile
+    requests = _get_requests()
     config_manager = ctx.obj['config']
     repo_config = config_manager.get_local_repo_config()
     config = config_manager.load_config()
@@ -497,42 +871,29 @@ def pull(ctx):
         click.echo("❌ Not in a RepoRouge repository or not logged in", err=True)
         return
     
-    api = RepoRougeAPI(config['server_url'], config['token'])
+    api = get_api(config['server_url'], config['token'])
     
     try:
         # Clone the current branch
-        zip_data = api.clone_repo(
+        zip_response = api.clone_repo(
             repo_config['owner'], 
             repo_config['repo_name'], 
             repo_config['current_branch']
         )
         
-        # Clear current directory (except .reporouge)
-        for item in Path('.').iterdir():
-            if item.name != '.reporouge':
-                if item.is_dir():
-                    shutil.rmtree(str(item))
-                else:
-                    item.unlink()
-        
-        # Extract new content
-        with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-            tmp_file.write(zip_data)
-            tmp_file.flush()
-            
-            with zipfile.ZipFile(tmp_file.name, 'r') as zip_ref:
-                for member in zip_ref.namelist():
-                    if not member.startswith('.reporouge/'):
-                        zip_ref.extract(member, '.')
-        
-        os.unlink(tmp_file.name)
+        # Extract new content over the working tree
+        with read_zip_response(zip_response) as spool:
+            _extract_over_worktree(spool)
+        config_manager.save_local_index(_build_index('.'))
         
         click.echo("✅ Successfully pulled latest changes")
         
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, OSError, zipfile.BadZipFile) as e:
         click.echo(f"❌ Pull failed: {e}", err=True)
 
 if __name__ == '__main__':
+    # Dependencies are only checked when run as a script, not on import
+    check_and_install_dependencies()
     try:
         cli()
     except KeyboardInterrupt:
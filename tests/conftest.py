@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# reporouge_cli.py is a standalone script at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
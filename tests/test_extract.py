@@ -0,0 +1,93 @@
+"""Tests for extracting a branch ZIP over an existing working tree"""
+
+import io
+import os
+import zipfile
+
+import pytest
+
+from reporouge_cli import _extract_over_worktree
+
+
+def make_zip(files):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as zip_ref:
+        for name, content in files.items():
+            zip_ref.writestr(name, content)
+    buffer.seek(0)
+    return buffer
+
+
+def write(path, content="x"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding='utf-8')
+
+
+def symlink(target, link, target_is_directory=False):
+    try:
+        os.symlink(target, link, target_is_directory=target_is_directory)
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks are not available here")
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    repo_dir = tmp_path / "repo"
+    repo_dir.mkdir()
+    monkeypatch.chdir(repo_dir)
+    return repo_dir
+
+
+def test_does_not_write_through_symlinked_directory(tmp_path, repo):
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    symlink(outside, repo / "src", target_is_directory=True)
+    
+    _extract_over_worktree(make_zip({"src/a.py": "print(1)\n"}))
+    
+    assert not (outside / "a.py").exists()
+    assert not (repo / "src").is_symlink()
+    assert (repo / "src" / "a.py").read_text(encoding='utf-8') == "print(1)\n"
+
+
+def test_does_not_write_through_symlinked_file(tmp_path, repo):
+    secret = tmp_path / "secret.txt"
+    write(secret, "keep me")
+    symlink(secret, repo / "README.md")
+    
+    _extract_over_worktree(make_zip({"README.md": "hello\n"}))
+    
+    assert secret.read_text(encoding='utf-8') == "keep me"
+    assert not (repo / "README.md").is_symlink()
+    assert (repo / "README.md").read_text(encoding='utf-8') == "hello\n"
+
+
+def test_file_replaced_by_directory(repo):
+    write(repo / "docs", "was a file")
+    
+    _extract_over_worktree(make_zip({"docs/guide.md": "guide\n"}))
+    
+    assert (repo / "docs").is_dir()
+    assert (repo / "docs" / "guide.md").read_text(encoding='utf-8') == "guide\n"
+
+
+def test_directory_replaced_by_file(repo):
+    write(repo / "docs" / "guide.md")
+    
+    _extract_over_worktree(make_zip({"docs": "now a file\n"}))
+    
+    assert (repo / "docs").read_text(encoding='utf-8') == "now a file\n"
+
+
+def test_stale_files_removed_and_empty_directories_pruned(repo):
+    write(repo / "old" / "deep" / "stale.txt")
+    write(repo / "mixed" / "stale.txt")
+    write(repo / "mixed" / "kept.txt", "old")
+    write(repo / ".reporouge" / "config.json", "{}")
+    
+    _extract_over_worktree(make_zip({"mixed/kept.txt": "new"}))
+    
+    assert not (repo / "old").exists()
+    assert not (repo / "mixed" / "stale.txt").exists()
+    assert (repo / "mixed" / "kept.txt").read_text(encoding='utf-8') == "new"
+    assert (repo / ".reporouge" / "config.json").exists()
@@ -0,0 +1,28 @@
+"""Tests for .reporougeignore handling (pattern matching itself is pathspec's job)"""
+
+from reporouge_cli import IGNORE_FILE, _iter_files, _load_ignore_spec
+
+
+def test_no_ignore_file(tmp_path):
+    assert _load_ignore_spec(str(tmp_path)) is None
+
+
+def test_ignore_file_follows_gitignore_rules(tmp_path):
+    (tmp_path / IGNORE_FILE).write_text("/TODO\n*.log\n!keep.log\n", encoding='utf-8')
+    ignored = _load_ignore_spec(str(tmp_path))
+    assert ignored("TODO")
+    assert not ignored("src/TODO")
+    assert ignored("logs/debug.log")
+    assert not ignored("keep.log")
+
+
+def test_ignored_directories_are_pruned(tmp_path):
+    (tmp_path / IGNORE_FILE).write_text("build/\n", encoding='utf-8')
+    for relative_path in ("build/out.js", "src/build/x.c", "src/a.py", ".reporouge/index.json"):
+        path = tmp_path / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x", encoding='utf-8')
+    
+    files = {relative_path for relative_path, _ in
+             _iter_files(str(tmp_path), _load_ignore_spec(str(tmp_path)))}
+    assert files == {IGNORE_FILE, "src/a.py"}